@@ -1,322 +1,480 @@
+import argparse
 import os
+import stat
 from pathlib import Path
 
-def create_file(path, content=""):
-    """Create a file with optional content"""
-    # Ensure the directory exists before creating the file
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, 'w') as f:
-        f.write(content)
+BASE = Path("wattschain-mlm-platform")
 
-def create_directory_structure():
-    """Create the wattschain-mlm-platform directory structure"""
-    base_dir = "wattschain-mlm-platform"
-    os.makedirs(base_dir, exist_ok=True)
-    
+# Every file to create, relative to BASE
+ALL_FILES = (
     # Root files
-    root_files = [
-        "README.md",
-        "package.json",
-        "next.config.js",
-        "tailwind.config.ts",
-        "postcss.config.js",
-        ".env.local",
-        ".env.example",
-        ".gitignore",
-        "tsconfig.json",
-        "components.json",
-        "middleware.ts",
-        "docker-compose.yml"
-    ]
-    
-    for file in root_files:
-        create_file(os.path.join(base_dir, file))
-
-    # Public directory structure
-    public_dirs = [
-        "public/images/payment-methods",
-        "public/locales/en",
-        "public/locales/sw"
-    ]
-    
-    for dir_path in public_dirs:
-        os.makedirs(os.path.join(base_dir, dir_path), exist_ok=True)
-    
-    public_files = {
-        "public/favicon.ico": "",
-        "public/logo.png": "",
-        "public/wattschain-logo.svg": "",
-        "public/images/kyc-verification.png": "",
-        "public/images/token-icon.png": "",
-        "public/locales/en/common.json": "",
-        "public/locales/sw/common.json": ""
-    }
-    
-    for file_path, content in public_files.items():
-        create_file(os.path.join(base_dir, file_path), content)
-
-    # Src directory structure
-    src_dirs = [
-        "src/app/(marketing)/about",
-        "src/app/(marketing)/whitepaper",
-        "src/app/(marketing)/legal/[type]",
-        "src/app/(marketing)/contact",
-        "src/app/(auth)/login",
-        "src/app/(auth)/register",
-        "src/app/(auth)/forgot-password",
-        "src/app/(auth)/verify-email",
-        "src/app/(auth)/invite/[code]",
-        "src/app/(dashboard)/dashboard",
-        "src/app/(dashboard)/profile",
-        "src/app/(dashboard)/wallet",
-        "src/app/(dashboard)/transactions",
-        "src/app/(dashboard)/token-purchase/checkout",
-        "src/app/(dashboard)/token-purchase/payment/[ivisethod]",
-        "src/app/(dashboard)/token-purchase/success",
-        "src/app/(dashboard)/affiliate/tree",
-        "src/app/(dashboard)/affiliate/commissions",
-        "src/app/(dashboard)/affiliate/referrals",
-        "src/app/(dashboard)/affiliate/withdraw",
-        "src/app/(dashboard)/kyc/verification",
-        "src/app/(dashboard)/kyc/status",
-        "src/app/(dashboard)/support/tickets",
-        "src/app/(dashboard)/support/faq",
-        "src/app/(admin)/admin/users",
-        "src/app/(admin)/admin/mlm/tree-audit",
-        "src/app/(admin)/admin/mlm/commissions",
-        "src/app/(admin)/admin/mlm/settings",
-        "src/app/(admin)/admin/transactions",
-        "src/app/(admin)/admin/kyc-reviews",
-        "src/app/(admin)/admin/token-pricing",
-        "src/app/(admin)/admin/reports",
-        "src/app/api/auth",
-        "src/app/api/user",
-        "src/app/api/token",
-        "src/app/api/payment/mpesa/[action]",
-        "src/app/api/payment/crypto/[action]",
-        "src/app/api/payment/stripe/[action]",
-        "src/app/api/mlm",
-        "src/app/api/kyc",
-        "src/app/api/admin",
-        "src/app/api/webhooks/payment/[provider]",
-        "src/app/api/webhooks/kyc",
-        "src/components/ui",
-        "src/components/layout",
-        "src/components/auth",
-        "src/components/dashboard",
-        "src/components/token",
-        "src/components/mlm",
-        "src/components/kyc",
-        "src/components/admin",
-        "src/components/payments",
-        "src/components/common",
-        "src/lib",
-        "src/types",
-        "src/models",
-        "src/hooks",
-        "src/context",
-        "src/store",
-        "src/middleware"
-    ]
-    
-    for dir_path in src_dirs:
-        os.makedirs(os.path.join(base_dir, dir_path), exist_ok=True)
-    
-    src_files = {
-        "src/app/globals.css": "",
-        "src/app/layout.tsx": "",
-        "src/app/page.tsx": "",
-        "src/app/loading.tsx": "",
-        "src/app/error.tsx": "",
-        "src/app/not-found.tsx": "",
-        "src/app/(marketing)/layout.tsx": "",
-        "src/app/(marketing)/about/page.tsx": "",
-        "src/app/(marketing)/whitepaper/page.tsx": "",
-        "src/app/(marketing)/legal/[type]/page.tsx": "",
-        "src/app/(marketing)/contact/page.tsx": "",
-        "src/app/(auth)/layout.tsx": "",
-        "src/app/(auth)/login/page.tsx": "",
-        "src/app/(auth)/register/page.tsx": "",
-        "src/app/(auth)/forgot-password/page.tsx": "",
-        "src/app/(auth)/verify-email/page.tsx": "",
-        "src/app/(auth)/invite/[code]/page.tsx": "",
-        "src/app/(dashboard)/layout.tsx": "",
-        "src/app/(dashboard)/dashboard/page.tsx": "",
-        "src/app/(dashboard)/profile/page.tsx": "",
-        "src/app/(dashboard)/wallet/page.tsx": "",
-        "src/app/(dashboard)/transactions/page.tsx": "",
-        "src/app/(dashboard)/token-purchase/page.tsx": "",
-        "src/app/(dashboard)/token-purchase/checkout/page.tsx": "",
-        "src/app/(dashboard)/token-purchase/payment/[method]/page.tsx": "",
-        "src/app/(dashboard)/token-purchase/success/page.tsx": "",
-        "src/app/(dashboard)/affiliate/page.tsx": "",
-        "src/app/(dashboard)/affiliate/tree/page.tsx": "",
-        "src/app/(dashboard)/affiliate/commissions/page.tsx": "",
-        "src/app/(dashboard)/affiliate/referrals/page.tsx": "",
-        "src/app/(dashboard)/affiliate/withdraw/page.tsx": "",
-        "src/app/(dashboard)/kyc/page.tsx": "",
-        "src/app/(dashboard)/kyc/verification/page.tsx": "",
-        "src/app/(dashboard)/kyc/status/page.tsx": "",
-        "src/app/(dashboard)/support/page.tsx": "",
-        "src/app/(dashboard)/support/tickets/page.tsx": "",
-        "src/app/(dashboard)/support/faq/page.tsx": "",
-        "src/app/(admin)/layout.tsx": "",
-        "src/app/(admin)/admin/page.tsx": "",
-        "src/app/(admin)/admin/users/page.tsx": "",
-        "src/app/(admin)/admin/mlm/page.tsx": "",
-        "src/app/(admin)/admin/mlm/tree-audit/page.tsx": "",
-        "src/app/(admin)/admin/mlm/commissions/page.tsx": "",
-        "src/app/(admin)/admin/mlm/settings/page.tsx": "",
-        "src/app/(admin)/admin/transactions/page.tsx": "",
-        "src/app/(admin)/admin/kyc-reviews/page.tsx": "",
-        "src/app/(admin)/admin/token-pricing/page.tsx": "",
-        "src/app/(admin)/admin/reports/page.tsx": "",
-        "src/app/api/auth/login/route.ts": "",
-        "src/app/api/auth/register/route.ts": "",
-        "src/app/api/auth/logout/route.ts": "",
-        "src/app/api/auth/verify-email/route.ts": "",
-        "src/app/api/user/profile/route.ts": "",
-        "src/app/api/user/wallet/route.ts": "",
-        "src/app/api/user/transactions/route.ts": "",
-        "src/app/api/token/purchase/route.ts": "",
-        "src/app/api/token/price/route.ts": "",
-        "src/app/api/token/balance/route.ts": "",
-        "src/app/api/payment/mpesa/[action]/route.ts": "",
-        "src/app/api/payment/crypto/[action]/route.ts": "",
-        "src/app/api/payment/stripe/[action]/route.ts": "",
-        "src/app/api/mlm/tree/route.ts": "",
-        "src/app/api/mlm/commissions/route.ts": "",
-        "src/app/api/mlm/referrals/route.ts": "",
-        "src/app/api/mlm/withdraw/route.ts": "",
-        "src/app/api/mlm/validate-referral/route.ts": "",
-        "src/app/api/kyc/submit/route.ts": "",
-        "src/app/api/kyc/status/route.ts": "",
-        "src/app/api/kyc/shuftipro-webhook/route.ts": "",
-        "src/app/api/admin/users/route.ts": "",
-        "src/app/api/admin/mlm/[action]/route.ts": "",
-        "src/app/api/admin/transactions/route.ts": "",
-        "src/app/api/admin/kyc-reviews/route.ts": "",
-        "src/app/api/admin/token-pricing/route.ts": "",
-        "src/app/api/admin/reports/route.ts": "",
-        "src/app/api/webhooks/payment/[provider]/route.ts": "",
-        "src/app/api/webhooks/kyc/shuftipro/route.ts": "",
-        "src/components/ui/button.tsx": "",
-        "src/components/ui/input.tsx": "",
-        "src/components/ui/card.tsx": "",
-        "src/components/ui/dialog.tsx": "",
-        "src/components/ui/table.tsx": "",
-        "src/components/ui/badge.tsx": "",
-        "src/components/ui/alert.tsx": "",
-        "src/components/ui/toast.tsx": "",
-        "src/components/ui/select.tsx": "",
-        "src/components/ui/textarea.tsx": "",
-        "src/components/ui/spinner.tsx": "",
-        "src/components/layout/Header.tsx": "",
-        "src/components/layout/Footer.tsx": "",
-        "src/components/layout/Sidebar.tsx": "",
-        "src/components/layout/DashboardLayout.tsx": "",
-        "src/components/auth/LoginForm.tsx": "",
-        "src/components/auth/RegisterForm.tsx": "",
-        "src/components/auth/ProtectedRoute.tsx": "",
-        "src/components/auth/KYCStatus.tsx": "",
-        "src/components/dashboard/DashboardStats.tsx": "",
-        "src/components/dashboard/WalletBalance.tsx": "",
-        "src/components/dashboard/RecentTransactions.tsx": "",
-        "src/components/token/TokenPurchaseForm.tsx": "",
-        "src/components/token/PresalePricing.tsx": "",
-        "src/components/token/PaymentMethods.tsx": "",
-        "src/components/mlm/ReferralTree.tsx": "",
-        "src/components/mlm/CommissionTracker.tsx": "",
-        "src/components/mlm/ReferralLink.tsx": "",
-        "src/components/mlm/WithdrawForm.tsx": "",
-        "src/components/mlm/LockPeriodDisplay.tsx": "",
-        "src/components/kyc/KYCForm.tsx": "",
-        "src/components/kyc/DocumentUpload.tsx": "",
-        "src/components/kyc/VerificationStatus.tsx": "",
-        "src/components/admin/UserManagement.tsx": "",
-        "src/components/admin/MLMTreeViewer.tsx": "",
-        "src/components/admin/CommissionManager.tsx": "",
-        "src/components/admin/KYCReviewPanel.tsx": "",
-        "src/components/admin/PresalePricingManager.tsx": "",
-        "src/components/admin/TransactionMonitor.tsx": "",
-        "src/components/payments/MPesaPayment.tsx": "",
-        "src/components/payments/CryptoPayment.tsx": "",
-        "src/components/payments/StripePayment.tsx": "",
-        "src/components/common/DataTable.tsx": "",
-        "src/components/common/LoadingSpinner.tsx": "",
-        "src/components/common/ErrorBoundary.tsx": "",
-        "src/lib/utils.ts": "",
-        "src/lib/constants.ts": "",
-        "src/lib/validations.ts": "",
-        "src/lib/auth.ts": "",
-        "src/lib/database.ts": "",
-        "src/lib/payments.ts": "",
-        "src/lib/kyc.ts": "",
-        "src/lib/mlm.ts": "",
-        "src/lib/email.ts": "",
-        "src/lib/presale-pricing.ts": "",
-        "src/types/index.ts": "",
-        "src/types/auth.ts": "",
-        "src/types/user.ts": "",
-        "src/types/transaction.ts": "",
-        "src/types/mlm.ts": "",
-        "src/types/kyc.ts": "",
-        "src/types/payment.ts": "",
-        "src/types/presale.ts": "",
-        "src/models/User.ts": "",
-        "src/models/Transaction.ts": "",
-        "src/models/MLMTree.ts": "",
-        "src/models/Commission.ts": "",
-        "src/models/KYC.ts": "",
-        "src/models/Token.ts": "",
-        "src/models/Wallet.ts": "",
-        "src/models/Payment.ts": "",
-        "src/models/PresaleRound.ts": "",
-        "src/hooks/useAuth.ts": "",
-        "src/hooks/useUser.ts": "",
-        "src/hooks/useMLM.ts": "",
-        "src/hooks/useTransactions.ts": "",
-        "src/hooks/useKYC.ts": "",
-        "src/hooks/usePayments.ts": "",
-        "src/hooks/usePresalePricing.ts": "",
-        "src/context/AuthContext.tsx": "",
-        "src/context/UserContext.tsx": "",
-        "src/context/MLMContext.tsx": "",
-        "src/store/authStore.ts": "",
-        "src/store/userStore.ts": "",
-        "src/store/mlmStore.ts": "",
-        "src/middleware/auth.ts": "",
-        "src/middleware/admin.ts": "",
-        "src/middleware/rateLimit.ts": ""
-    }
-    
-    for file_path, content in src_files.items():
-        create_file(os.path.join(base_dir, file_path), content)
-
-    # Data directory
-    os.makedirs(os.path.join(base_dir, "data"), exist_ok=True)
-    create_file(os.path.join(base_dir, "data/presale-pricing.json"), "")
-
-    # Docs directory
-    docs_files = [
-        "docs/API.md",
-        "docs/MLM_LOGIC.md",
-        "docs/PRESALE_ROUNDS.md"
-    ]
-    
-    for file in docs_files:
-        create_file(os.path.join(base_dir, file))
-
-    # Tests directory
-    test_dirs = [
-        "tests/components",
-        "tests/api",
-        "tests/lib"
-    ]
-    
-    for dir_path in test_dirs:
-        os.makedirs(os.path.join(base_dir, dir_path), exist_ok=True)
+    "README.md",
+    "package.json",
+    "next.config.js",
+    "tailwind.config.ts",
+    "postcss.config.js",
+    ".env.local",
+    ".env.example",
+    ".gitignore",
+    "tsconfig.json",
+    "components.json",
+    "middleware.ts",
+    "docker-compose.yml",
+
+    # Public files
+    "public/favicon.ico",
+    "public/logo.png",
+    "public/wattschain-logo.svg",
+    "public/images/kyc-verification.png",
+    "public/images/token-icon.png",
+    "public/locales/en/common.json",
+    "public/locales/sw/common.json",
+
+    # Src files
+    "src/app/globals.css",
+    "src/app/layout.tsx",
+    "src/app/page.tsx",
+    "src/app/loading.tsx",
+    "src/app/error.tsx",
+    "src/app/not-found.tsx",
+    "src/app/(marketing)/layout.tsx",
+    "src/app/(marketing)/about/page.tsx",
+    "src/app/(marketing)/whitepaper/page.tsx",
+    "src/app/(marketing)/legal/[type]/page.tsx",
+    "src/app/(marketing)/contact/page.tsx",
+    "src/app/(auth)/layout.tsx",
+    "src/app/(auth)/login/page.tsx",
+    "src/app/(auth)/register/page.tsx",
+    "src/app/(auth)/forgot-password/page.tsx",
+    "src/app/(auth)/verify-email/page.tsx",
+    "src/app/(auth)/invite/[code]/page.tsx",
+    "src/app/(dashboard)/layout.tsx",
+    "src/app/(dashboard)/dashboard/page.tsx",
+    "src/app/(dashboard)/profile/page.tsx",
+    "src/app/(dashboard)/wallet/page.tsx",
+    "src/app/(dashboard)/transactions/page.tsx",
+    "src/app/(dashboard)/token-purchase/page.tsx",
+    "src/app/(dashboard)/token-purchase/checkout/page.tsx",
+    "src/app/(dashboard)/token-purchase/payment/[method]/page.tsx",
+    "src/app/(dashboard)/token-purchase/success/page.tsx",
+    "src/app/(dashboard)/affiliate/page.tsx",
+    "src/app/(dashboard)/affiliate/tree/page.tsx",
+    "src/app/(dashboard)/affiliate/commissions/page.tsx",
+    "src/app/(dashboard)/affiliate/referrals/page.tsx",
+    "src/app/(dashboard)/affiliate/withdraw/page.tsx",
+    "src/app/(dashboard)/kyc/page.tsx",
+    "src/app/(dashboard)/kyc/verification/page.tsx",
+    "src/app/(dashboard)/kyc/status/page.tsx",
+    "src/app/(dashboard)/support/page.tsx",
+    "src/app/(dashboard)/support/tickets/page.tsx",
+    "src/app/(dashboard)/support/faq/page.tsx",
+    "src/app/(admin)/layout.tsx",
+    "src/app/(admin)/admin/page.tsx",
+    "src/app/(admin)/admin/users/page.tsx",
+    "src/app/(admin)/admin/mlm/page.tsx",
+    "src/app/(admin)/admin/mlm/tree-audit/page.tsx",
+    "src/app/(admin)/admin/mlm/commissions/page.tsx",
+    "src/app/(admin)/admin/mlm/settings/page.tsx",
+    "src/app/(admin)/admin/transactions/page.tsx",
+    "src/app/(admin)/admin/kyc-reviews/page.tsx",
+    "src/app/(admin)/admin/token-pricing/page.tsx",
+    "src/app/(admin)/admin/reports/page.tsx",
+    "src/app/api/auth/login/route.ts",
+    "src/app/api/auth/register/route.ts",
+    "src/app/api/auth/logout/route.ts",
+    "src/app/api/auth/verify-email/route.ts",
+    "src/app/api/user/profile/route.ts",
+    "src/app/api/user/wallet/route.ts",
+    "src/app/api/user/transactions/route.ts",
+    "src/app/api/token/purchase/route.ts",
+    "src/app/api/token/price/route.ts",
+    "src/app/api/token/balance/route.ts",
+    "src/app/api/payment/mpesa/[action]/route.ts",
+    "src/app/api/payment/crypto/[action]/route.ts",
+    "src/app/api/payment/stripe/[action]/route.ts",
+    "src/app/api/mlm/tree/route.ts",
+    "src/app/api/mlm/commissions/route.ts",
+    "src/app/api/mlm/referrals/route.ts",
+    "src/app/api/mlm/withdraw/route.ts",
+    "src/app/api/mlm/validate-referral/route.ts",
+    "src/app/api/kyc/submit/route.ts",
+    "src/app/api/kyc/status/route.ts",
+    "src/app/api/kyc/shuftipro-webhook/route.ts",
+    "src/app/api/admin/users/route.ts",
+    "src/app/api/admin/mlm/[action]/route.ts",
+    "src/app/api/admin/transactions/route.ts",
+    "src/app/api/admin/kyc-reviews/route.ts",
+    "src/app/api/admin/token-pricing/route.ts",
+    "src/app/api/admin/reports/route.ts",
+    "src/app/api/webhooks/payment/[provider]/route.ts",
+    "src/app/api/webhooks/kyc/shuftipro/route.ts",
+    "src/components/ui/button.tsx",
+    "src/components/ui/input.tsx",
+    "src/components/ui/card.tsx",
+    "src/components/ui/dialog.tsx",
+    "src/components/ui/table.tsx",
+    "src/components/ui/badge.tsx",
+    "src/components/ui/alert.tsx",
+    "src/components/ui/toast.tsx",
+    "src/components/ui/select.tsx",
+    "src/components/ui/textarea.tsx",
+    "src/components/ui/spinner.tsx",
+    "src/components/layout/Header.tsx",
+    "src/components/layout/Footer.tsx",
+    "src/components/layout/Sidebar.tsx",
+    "src/components/layout/DashboardLayout.tsx",
+    "src/components/auth/LoginForm.tsx",
+    "src/components/auth/RegisterForm.tsx",
+    "src/components/auth/ProtectedRoute.tsx",
+    "src/components/auth/KYCStatus.tsx",
+    "src/components/dashboard/DashboardStats.tsx",
+    "src/components/dashboard/WalletBalance.tsx",
+    "src/components/dashboard/RecentTransactions.tsx",
+    "src/components/token/TokenPurchaseForm.tsx",
+    "src/components/token/PresalePricing.tsx",
+    "src/components/token/PaymentMethods.tsx",
+    "src/components/mlm/ReferralTree.tsx",
+    "src/components/mlm/CommissionTracker.tsx",
+    "src/components/mlm/ReferralLink.tsx",
+    "src/components/mlm/WithdrawForm.tsx",
+    "src/components/mlm/LockPeriodDisplay.tsx",
+    "src/components/kyc/KYCForm.tsx",
+    "src/components/kyc/DocumentUpload.tsx",
+    "src/components/kyc/VerificationStatus.tsx",
+    "src/components/admin/UserManagement.tsx",
+    "src/components/admin/MLMTreeViewer.tsx",
+    "src/components/admin/CommissionManager.tsx",
+    "src/components/admin/KYCReviewPanel.tsx",
+    "src/components/admin/PresalePricingManager.tsx",
+    "src/components/admin/TransactionMonitor.tsx",
+    "src/components/payments/MPesaPayment.tsx",
+    "src/components/payments/CryptoPayment.tsx",
+    "src/components/payments/StripePayment.tsx",
+    "src/components/common/DataTable.tsx",
+    "src/components/common/LoadingSpinner.tsx",
+    "src/components/common/ErrorBoundary.tsx",
+    "src/lib/utils.ts",
+    "src/lib/constants.ts",
+    "src/lib/validations.ts",
+    "src/lib/auth.ts",
+    "src/lib/database.ts",
+    "src/lib/payments.ts",
+    "src/lib/kyc.ts",
+    "src/lib/mlm.ts",
+    "src/lib/email.ts",
+    "src/lib/presale-pricing.ts",
+    "src/types/index.ts",
+    "src/types/auth.ts",
+    "src/types/user.ts",
+    "src/types/transaction.ts",
+    "src/types/mlm.ts",
+    "src/types/kyc.ts",
+    "src/types/payment.ts",
+    "src/types/presale.ts",
+    "src/models/User.ts",
+    "src/models/Transaction.ts",
+    "src/models/MLMTree.ts",
+    "src/models/Commission.ts",
+    "src/models/KYC.ts",
+    "src/models/Token.ts",
+    "src/models/Wallet.ts",
+    "src/models/Payment.ts",
+    "src/models/PresaleRound.ts",
+    "src/hooks/useAuth.ts",
+    "src/hooks/useUser.ts",
+    "src/hooks/useMLM.ts",
+    "src/hooks/useTransactions.ts",
+    "src/hooks/useKYC.ts",
+    "src/hooks/usePayments.ts",
+    "src/hooks/usePresalePricing.ts",
+    "src/context/AuthContext.tsx",
+    "src/context/UserContext.tsx",
+    "src/context/MLMContext.tsx",
+    "src/store/authStore.ts",
+    "src/store/userStore.ts",
+    "src/store/mlmStore.ts",
+    "src/middleware/auth.ts",
+    "src/middleware/admin.ts",
+    "src/middleware/rateLimit.ts",
+
+    # Data files
+    "data/presale-pricing.json",
+
+    # Docs files
+    "docs/API.md",
+    "docs/MLM_LOGIC.md",
+    "docs/PRESALE_ROUNDS.md",
+)
+
+# (file, parent relative to BASE, parent, path) for every entry in
+# ALL_FILES, worked out once at import so nothing splits paths at run time
+FILE_ENTRIES = tuple(
+    (file, file.rpartition("/")[0], (BASE / file).parent, BASE / file)
+    for file in ALL_FILES
+)
+
+# Files that need something other than empty content
+FILE_CONTENTS = {}
+
+# Directories that have no files in them, or that should exist regardless
+EXTRA_DIRS = (
+    # Public
+    "public/images/payment-methods",
+    "public/locales/en",
+    "public/locales/sw",
+
+    # Src
+    "src/app/(marketing)/about",
+    "src/app/(marketing)/whitepaper",
+    "src/app/(marketing)/legal/[type]",
+    "src/app/(marketing)/contact",
+    "src/app/(auth)/login",
+    "src/app/(auth)/register",
+    "src/app/(auth)/forgot-password",
+    "src/app/(auth)/verify-email",
+    "src/app/(auth)/invite/[code]",
+    "src/app/(dashboard)/dashboard",
+    "src/app/(dashboard)/profile",
+    "src/app/(dashboard)/wallet",
+    "src/app/(dashboard)/transactions",
+    "src/app/(dashboard)/token-purchase/checkout",
+    "src/app/(dashboard)/token-purchase/success",
+    "src/app/(dashboard)/affiliate/tree",
+    "src/app/(dashboard)/affiliate/commissions",
+    "src/app/(dashboard)/affiliate/referrals",
+    "src/app/(dashboard)/affiliate/withdraw",
+    "src/app/(dashboard)/kyc/verification",
+    "src/app/(dashboard)/kyc/status",
+    "src/app/(dashboard)/support/tickets",
+    "src/app/(dashboard)/support/faq",
+    "src/app/(admin)/admin/users",
+    "src/app/(admin)/admin/mlm/tree-audit",
+    "src/app/(admin)/admin/mlm/commissions",
+    "src/app/(admin)/admin/mlm/settings",
+    "src/app/(admin)/admin/transactions",
+    "src/app/(admin)/admin/kyc-reviews",
+    "src/app/(admin)/admin/token-pricing",
+    "src/app/(admin)/admin/reports",
+    "src/app/api/auth",
+    "src/app/api/user",
+    "src/app/api/token",
+    "src/app/api/payment/mpesa/[action]",
+    "src/app/api/payment/crypto/[action]",
+    "src/app/api/payment/stripe/[action]",
+    "src/app/api/mlm",
+    "src/app/api/kyc",
+    "src/app/api/admin",
+    "src/app/api/webhooks/payment/[provider]",
+    "src/app/api/webhooks/kyc",
+    "src/components/ui",
+    "src/components/layout",
+    "src/components/auth",
+    "src/components/dashboard",
+    "src/components/token",
+    "src/components/mlm",
+    "src/components/kyc",
+    "src/components/admin",
+    "src/components/payments",
+    "src/components/common",
+    "src/lib",
+    "src/types",
+    "src/models",
+    "src/hooks",
+    "src/context",
+    "src/store",
+    "src/middleware",
+
+    # Tests
+    "tests/components",
+    "tests/api",
+    "tests/lib",
+)
+
+# os.makedirs on Windows probes every level with an exists() check and an
+# exception; CreateDirectoryW on the leaf usually succeeds outright and only
+# has to walk up when it reports a missing parent
+if os.name == "nt":
+    import ctypes
+
+    ERROR_PATH_NOT_FOUND = 3
+    ERROR_ALREADY_EXISTS = 183
+
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _kernel32.CreateDirectoryW.argtypes = (ctypes.c_wchar_p, ctypes.c_void_p)
+
+    def makedirs(path):
+        """Create a directory and its parents with CreateDirectoryW"""
+        path = os.fspath(path)
+        if _kernel32.CreateDirectoryW(path, None):
+            return
+        error = ctypes.get_last_error()
+        if error == ERROR_PATH_NOT_FOUND:
+            parent = os.path.dirname(path)
+            if parent and parent != path:
+                makedirs(parent)
+                if _kernel32.CreateDirectoryW(path, None):
+                    return
+                error = ctypes.get_last_error()
+        # Like os.makedirs, an existing directory is fine but a file is not
+        if error == ERROR_ALREADY_EXISTS and os.path.isdir(path):
+            return
+        raise ctypes.WinError(error)
+else:
+    def makedirs(path):
+        """Create a directory and its parents"""
+        os.makedirs(path, exist_ok=True)
+
+def ensure_dir(path, created):
+    """Create a directory and its parents unless they are already in created"""
+    if path in created:
+        return
+    makedirs(path)
+    for done in (path, *path.parents):
+        if done in created:
+            break
+        created.add(done)
+
+def write_file(path, content):
+    """Write a file whose directory is expected to exist"""
+    if not content:
+        # Nothing to write, so skip the buffered file object entirely
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        os.close(fd)
+        return
+    # A 64 KiB buffer rather than the 8 KiB default, so larger templates
+    # go out in fewer write() calls
+    with open(path, 'w', encoding='utf-8', buffering=1 << 16) as f:
+        f.write(content)
+
+def create_file(parent, path, content=""):
+    """Create a file in parent with optional content"""
+    # Open first and only fall back to makedirs when the directory is
+    # missing, which the up-front directory pass makes the rare case
+    try:
+        write_file(path, content)
+    except FileNotFoundError:
+        makedirs(parent)
+        write_file(path, content)
+
+def scan_existing():
+    """Find which of the script's own directories and empty files already exist
+
+    Only paths from ALL_FILES and EXTRA_DIRS are looked at, never anything
+    else under BASE such as node_modules. Paths are relative to BASE.
+    """
+    # Nothing can exist yet on a fresh run, so skip the checks entirely
+    if not BASE.is_dir():
+        return set(), set()
+    candidates = {relative_parent for _, relative_parent, _, _ in FILE_ENTRIES}
+    candidates.update(EXTRA_DIRS)
+    dirs = {relative for relative in candidates if os.path.isdir(BASE / relative)}
+    empty_files = set()
+    for file, relative_parent, _, path in FILE_ENTRIES:
+        # A missing directory means none of its files can be there either
+        if relative_parent not in dirs:
+            continue
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            continue
+        if stat.S_ISREG(st.st_mode) and st.st_size == 0:
+            empty_files.add(file)
+    return dirs, empty_files
+
+def subtree_of(relative_path):
+    """Name the independent subtree a path relative to BASE belongs to"""
+    parts = relative_path.split("/")
+    if parts[0] == "src" and parts[1] in ("app", "components"):
+        return "/".join(parts[:2])
+    return parts[0] if len(parts) > 1 else ""
+
+def run_all(executor, function, calls):
+    """Run function over each argument tuple in calls and wait for all of them"""
+    futures = [executor.submit(function, *args) for args in calls]
+    for future in futures:
+        future.result()
+
+def create_files(files, threads):
+    """Create (parent, path, content) entries concurrently on up to threads threads"""
+    # Imported here so the default sequential run does not pay for it
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        run_all(pool, create_file, files)
+
+def create_subtree(dirs, files, threads=0):
+    """Create one subtree's directories and files; runs in a worker process"""
+    # Only the leaf directories need makedirs; it fills in their parents.
+    # Deepest first, so every descendant is seen before its ancestors. The
+    # record of what was created lives only for this call, so a later call
+    # never trusts directories that may have been removed in between
+    created = set()
+    for dir_path in sorted(dirs, key=lambda d: len(d.parts), reverse=True):
+        ensure_dir(dir_path, created)
+    if threads:
+        create_files(files, threads)
+        return
+    for file in files:
+        create_file(*file)
+
+def create_directory_structure(workers=1, threads=0):
+    """Create the wattschain-mlm-platform directory structure
+
+    workers > 1 spreads the independent subtrees over that many processes,
+    and threads > 0 overlaps file creations on that many threads. Both only
+    pay off on slow (network or FUSE) filesystems; on a local disk the
+    process and thread overhead costs more than the syscalls it overlaps.
+    """
+    # The subtrees share no directories below BASE/src, so they can be
+    # created independently. Anything already in place from an earlier run
+    # is left alone, so re-runs only fill in what is missing
+    existing_dirs, existing_files = scan_existing()
+    subtrees = {}
+    for file, relative_parent, parent, path in FILE_ENTRIES:
+        content = FILE_CONTENTS.get(file, "")
+        if not content and file in existing_files:
+            continue
+        dirs, files = subtrees.setdefault(subtree_of(file), (set(), []))
+        if relative_parent not in existing_dirs:
+            dirs.add(parent)
+        files.append((parent, path, content))
+    for dir_path in EXTRA_DIRS:
+        if dir_path not in existing_dirs:
+            subtrees.setdefault(subtree_of(dir_path), (set(), []))[0].add(BASE / dir_path)
+
+    if not subtrees:
+        return
+
+    if workers <= 1:
+        for dirs, files in subtrees.values():
+            create_subtree(dirs, files, threads)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(subtrees))) as pool:
+        run_all(pool, create_subtree, ((dirs, files, threads) for dirs, files in subtrees.values()))
+
+def non_negative_int(value):
+    """argparse type for a count that may be zero"""
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or more, got {number}")
+    return number
+
+def positive_int(value):
+    """argparse type for a count of at least one"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be 1 or more, got {number}")
+    return number
 
 if __name__ == "__main__":
-    create_directory_structure()
-    print("Directory structure created successfully!")
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Create the wattschain-mlm-platform directory structure")
+    parser.add_argument("--workers", type=positive_int, default=1,
+                        help="processes to spread the subtrees over (for slow filesystems)")
+    parser.add_argument("--threads", type=non_negative_int, default=0,
+                        help="threads to overlap file creations on (for slow filesystems)")
+    args = parser.parse_args()
+    create_directory_structure(args.workers, args.threads)
+    print("Directory structure created successfully!")